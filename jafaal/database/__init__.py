@@ -3,6 +3,7 @@ from jafaal.database_sqlalchemy import (
     SQLAlchemyBaseUserTable,
     SQLAlchemyBaseUserTableUUID,
     SQLAlchemyUserDatabase,
+    create_async_user_engine,
 )
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "SQLAlchemyBaseUserTable",
     "SQLAlchemyBaseUserTableUUID",
     "SQLAlchemyUserDatabase",
+    "create_async_user_engine",
 ]
@@ -19,12 +19,22 @@ class BaseUserDatabase(Generic[UP, ID]):
 
             Retrieve a user by their OAuth provider and account ID.
 
+            Retrieve several users by their unique identifiers.
+
+            Retrieve several users by their email addresses.
+
             Create a new user with the provided data.
 
             Update an existing user with the provided data.
 
             Delete the specified user from the database.
 
+            Create several users in a single operation.
+
+            Update several users in a single operation.
+
+            Delete several users in a single operation.
+
     All methods must be implemented by subclasses.
     """
 
@@ -58,6 +68,36 @@ class BaseUserDatabase(Generic[UP, ID]):
         """
         raise NotImplementedError()
 
+    async def get_many(self, user_ids: list[ID]) -> list[UP]:
+        """
+        Retrieve several users by their unique identifiers in a single operation.
+
+        Args:
+            user_ids (list[ID]): The unique identifiers of the users to retrieve.
+
+        Returns:
+            list[UP]: The users found. Unknown identifiers are skipped.
+
+        Raises:
+            NotImplementedError: If the method is not implemented in a subclass.
+        """
+        raise NotImplementedError()
+
+    async def get_by_emails(self, emails: list[str]) -> list[UP]:
+        """
+        Retrieve several users by their email addresses in a single operation.
+
+        Args:
+            emails (list[str]): The email addresses of the users to retrieve.
+
+        Returns:
+            list[UP]: The users found. Unknown email addresses are skipped.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError()
+
     async def create(self, create_dict: dict[str, Any]) -> UP:
         """
         Asynchronously creates a new record in the database using the provided dictionary of values.
@@ -101,6 +141,46 @@ class BaseUserDatabase(Generic[UP, ID]):
         """
         raise NotImplementedError()
 
+    async def create_many(self, create_dicts: list[dict[str, Any]]) -> list[UP]:
+        """
+        Asynchronously creates several records in the database in a single operation.
+
+        Args:
+            create_dicts (list[dict[str, Any]]): A list of dictionaries, one per record to create.
+
+        Returns:
+            list[UP]: The created record instances.
+
+        Raises:
+            NotImplementedError: If the method is not implemented in the subclass.
+        """
+        raise NotImplementedError()
+
+    async def update_many(self, update_dicts: list[dict[str, Any]]) -> None:
+        """
+        Asynchronously updates several users in a single operation.
+
+        Args:
+            update_dicts (list[dict[str, Any]]): A list of dictionaries, each containing the user's
+                identifier ("id") and the fields to update.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError()
+
+    async def delete_many(self, user_ids: list[ID]) -> None:
+        """
+        Asynchronously deletes several users from the database in a single operation.
+
+        Args:
+            user_ids (list[ID]): The unique identifiers of the users to delete.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError()
+
 
 # A FastAPI dependency type alias for any callable that provides a BaseUserDatabase instance.
 # This can be:
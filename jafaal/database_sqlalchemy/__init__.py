@@ -3,9 +3,11 @@ from jafaal.database_sqlalchemy.base import (
     SQLAlchemyBaseUserTableUUID,
     SQLAlchemyUserDatabase,
 )
+from jafaal.database_sqlalchemy.engine import create_async_user_engine
 
 __all__ = [
     "SQLAlchemyBaseUserTable",
     "SQLAlchemyBaseUserTableUUID",
     "SQLAlchemyUserDatabase",
+    "create_async_user_engine",
 ]
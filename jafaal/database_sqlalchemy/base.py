@@ -1,17 +1,84 @@
 import uuid
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, Generic
 
 from jafaal.database.base import BaseUserDatabase
 from jafaal.models import ID, UP
-from sqlalchemy import Boolean, String, func, select
+from sqlalchemy import (
+    Column,
+    Index,
+    SmallInteger,
+    String,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql import Select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.sql import Executable
 
 from jafaal.database_sqlalchemy.generics import GUID
 
 UUID_ID = uuid.UUID
 
+# Maximum number of rows rendered into a single INSERT statement by bulk operations
+BULK_PAGE_SIZE = 1000
+
+# Bits of the packed `flags` column of the users table
+USER_FLAG_ACTIVE = 1 << 0
+USER_FLAG_SUPERUSER = 1 << 1
+USER_FLAG_VERIFIED = 1 << 2
+# Flags of a new user: active, not a superuser and not verified
+USER_FLAGS_DEFAULT = USER_FLAG_ACTIVE
+
+_USER_FLAG_BITS = {
+    "is_active": USER_FLAG_ACTIVE,
+    "is_superuser": USER_FLAG_SUPERUSER,
+    "is_verified": USER_FLAG_VERIFIED,
+}
+
+
+def _flag_property(name: str) -> hybrid_property:
+    """
+    Builds a boolean hybrid property backed by one bit of the `flags` column.
+
+    On instances the property reads and writes the bit; in SQL expressions it renders as
+    `flags & bit != 0`, so filters such as `User.is_active == True` keep working.
+
+    Args:
+        name (str): The attribute name of the property, a key of `_USER_FLAG_BITS`.
+
+    Returns:
+        hybrid_property: The boolean property.
+    """
+    bit = _USER_FLAG_BITS[name]
+
+    def fget(self) -> bool:
+        flags = USER_FLAGS_DEFAULT if self.flags is None else self.flags
+        return bool(flags & bit)
+
+    def fset(self, value: bool) -> None:
+        flags = USER_FLAGS_DEFAULT if self.flags is None else self.flags
+        self.flags = flags | bit if value else flags & ~bit
+
+    def expr(cls):
+        return cls.flags.op("&")(bit) != 0
+
+    def update_expr(cls, value: bool):
+        if value:
+            return [(cls.flags, cls.flags.op("|")(bit))]
+        return [(cls.flags, cls.flags.op("&")(~bit))]
+
+    # The hybrid finds its attribute by the getter's name, which ORM UPDATE statements need
+    fget.__name__ = name
+    return hybrid_property(fget, fset, expr=expr, update_expr=update_expr)
+
 
 class SQLAlchemyBaseUserTable(Generic[ID]):
     """
@@ -24,9 +91,17 @@ class SQLAlchemyBaseUserTable(Generic[ID]):
         id (ID): The unique identifier for the user (type depends on the generic parameter).
         email (str): The user's email address, unique and indexed.
         hashed_password (str): The user's hashed password.
+        flags (int): The user's boolean flags, packed into a single SMALLINT column.
         is_active (bool): Indicates whether the user account is active.
         is_superuser (bool): Indicates whether the user has superuser privileges.
         is_verified (bool): Indicates whether the user's email is verified.
+
+    Emails are stored lowercased and a unique index on `lower(email)` backs the
+    case-insensitive lookups done by `SQLAlchemyUserDatabase.get_by_email`.
+
+    `is_active`, `is_superuser` and `is_verified` are hybrid properties over the bits
+    USER_FLAG_ACTIVE, USER_FLAG_SUPERUSER and USER_FLAG_VERIFIED of `flags`, which are
+    always fetched together and stored in a single column instead of three.
     """
     __tablename__ = "users"
 
@@ -34,6 +109,7 @@ class SQLAlchemyBaseUserTable(Generic[ID]):
         id: ID
         email: str
         hashed_password: str
+        flags: int
         is_active: bool
         is_superuser: bool
         is_verified: bool
@@ -44,12 +120,27 @@ class SQLAlchemyBaseUserTable(Generic[ID]):
         hashed_password: Mapped[str] = mapped_column(
             String(length=1024), nullable=False
         )
-        is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-        is_superuser: Mapped[bool] = mapped_column(
-            Boolean, default=False, nullable=False
+        flags: Mapped[int] = mapped_column(
+            SmallInteger, default=USER_FLAGS_DEFAULT, nullable=False
         )
-        is_verified: Mapped[bool] = mapped_column(
-            Boolean, default=False, nullable=False
+        is_active = _flag_property("is_active")
+        is_superuser = _flag_property("is_superuser")
+        is_verified = _flag_property("is_verified")
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple:
+        """
+        Declares the unique functional index on the lowercased email column.
+
+        Returns:
+            tuple: The table arguments for the mapped users table.
+        """
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_email_lower",
+                func.lower(cls.email),
+                unique=True,
+            ),
         )
 
 
@@ -95,6 +186,12 @@ class SQLAlchemyUserDatabase(Generic[UP, ID], BaseUserDatabase[UP, ID]):
         async get_by_email(email: str) -> UP | None:
             Retrieves a user by their email address (case-insensitive).
 
+        async get_many(user_ids: list[ID]) -> list[UP]:
+            Retrieves several users by their primary keys in a single query.
+
+        async get_by_emails(emails: list[str]) -> list[UP]:
+            Retrieves several users by their email addresses (case-insensitive) in a single query.
+
         async create(create_dict: dict[str, Any]) -> UP:
             Creates a new user with the provided attributes.
 
@@ -104,8 +201,26 @@ class SQLAlchemyUserDatabase(Generic[UP, ID], BaseUserDatabase[UP, ID]):
         async delete(user: UP) -> None:
             Deletes the specified user from the database.
 
-        async _get_user(statement: Select) -> UP | None:
+        async create_many(create_dicts: list[dict[str, Any]]) -> list[UP]:
+            Creates several users in a single transaction.
+
+        async update_many(update_dicts: list[dict[str, Any]]) -> None:
+            Updates several users, identified by primary key, in a single transaction.
+
+        async delete_many(user_ids: list[ID]) -> None:
+            Deletes several users, identified by primary key, in a single transaction.
+
+        async copy_from(records: Iterable[dict[str, Any]]) -> int:
+            Bulk loads users with PostgreSQL COPY, falling back to `create_many` elsewhere.
+
+        async _get_user(statement: Executable, params: dict[str, Any] | None) -> UP | None:
             Executes the given SQLAlchemy select statement and returns a single user or None.
+
+        _remember_email(user: UP) -> None:
+            Records the user's identifier under their email for later `get_by_email` calls.
+
+        _forget_email(user_id: ID) -> None:
+            Removes the email index entry of a user.
     """
     session: AsyncSession
     user_table: type[UP]
@@ -125,55 +240,141 @@ class SQLAlchemyUserDatabase(Generic[UP, ID], BaseUserDatabase[UP, ID]):
         """
         self.session = session
         self.user_table = user_table
+        # Built once and shared by the email lookups, only the compared values change per call
+        self._email_lower_col = email_lower = func.lower(user_table.email)
+        # Built once so SQLAlchemy caches the compiled lookup by the lambda's code location
+        self._get_by_email_statement = lambda_stmt(
+            lambda: select(user_table).where(email_lower == bindparam("email"))
+        )
+        # Lowercased email to identifier of the users seen through this session, so repeated
+        # email lookups resolve through the session's identity map
+        self._email_index: dict[str, ID] = {}
 
     async def get(self, user_id: ID) -> UP | None:
         """
         Retrieve a user record by its unique identifier.
 
+        Users already loaded in the session are returned from its identity map without a
+        database round-trip; otherwise a primary key SELECT is emitted.
+
         Args:
             user_id (ID): The unique identifier of the user to retrieve.
 
         Returns:
             UP | None: The user object if found, otherwise None.
         """
-        statement = select(self.user_table).where(self.user_table.id == user_id)
-        return await self._get_user(statement)
+        return await self.session.get(self.user_table, user_id)
 
     async def get_by_email(self, email: str) -> UP | None:
         """
         Asynchronously retrieves a user by their email address.
 
+        Users already looked up, created or updated through this instance are resolved by
+        identifier with `session.get`, which is served from the session's identity map.
+
         Args:
             email (str): The email address of the user to retrieve.
 
         Returns:
             UP | None: The user object if found, otherwise None.
         """
+        email = email.lower()
+        user_id = self._email_index.get(email)
+        if user_id is not None:
+            user = await self.session.get(self.user_table, user_id)
+            if user is not None and user.email.lower() == email:
+                return user
+            # The user was deleted or changed email outside of this instance
+            del self._email_index[email]
+
+        user = await self._get_user(self._get_by_email_statement, {"email": email})
+        if user is not None:
+            self._remember_email(user)
+        return user
+
+    async def get_many(self, user_ids: list[ID]) -> list[UP]:
+        """
+        Asynchronously retrieves several users by their unique identifiers in a single query.
+
+        The loaded users are added to the session's identity map, so later `get` calls for the
+        same identifiers are served without a database round-trip.
+
+        Args:
+            user_ids (list[ID]): The unique identifiers of the users to retrieve.
+
+        Returns:
+            list[UP]: The users found, in no particular order. Unknown identifiers are skipped.
+        """
+        if not user_ids:
+            return []
+        statement = select(self.user_table).where(self.user_table.id.in_(user_ids))
+        return list((await self.session.scalars(statement)).all())
+
+    async def get_by_emails(self, emails: list[str]) -> list[UP]:
+        """
+        Asynchronously retrieves several users by their email addresses in a single query.
+
+        Args:
+            emails (list[str]): The email addresses of the users to retrieve, compared case-insensitively.
+
+        Returns:
+            list[UP]: The users found, in no particular order. Unknown email addresses are skipped.
+        """
+        if not emails:
+            return []
         statement = select(self.user_table).where(
-            func.lower(self.user_table.email) == func.lower(email)
+            self._email_lower_col.in_([email.lower() for email in emails])
         )
-        return await self._get_user(statement)
+        return list((await self.session.scalars(statement)).all())
 
     async def create(self, create_dict: dict[str, Any]) -> UP:
         """
         Asynchronously creates a new user record in the database.
 
+        When the session keeps its instances loaded on commit (`expire_on_commit=False`) and
+        the dialect supports INSERT ... RETURNING, the created row is loaded by the INSERT
+        itself instead of being refreshed after the commit. That path bypasses the unit of
+        work, so mapper events and `@validates` hooks do not fire for it.
+
         Args:
             create_dict (dict[str, Any]): A dictionary containing the fields and values for the new user.
 
         Returns:
             UP: The newly created user instance after being committed and refreshed from the database.
         """
-        user = self.user_table(**create_dict)
-        self.session.add(user)
+        create_dict = _lower_email(create_dict)
+        connection = await self.session.connection()
+        if (
+            self.session.sync_session.expire_on_commit
+            or not connection.dialect.insert_returning
+        ):
+            user = self.user_table(**create_dict)
+            self.session.add(user)
+            await self.session.commit()
+            await self.session.refresh(user)
+            self._remember_email(user)
+            return user
+
+        statement = (
+            insert(self.user_table)
+            .values(**_pack_flags(create_dict, USER_FLAGS_DEFAULT))
+            .returning(self.user_table)
+            .execution_options(populate_existing=True)
+        )
+        user = (await self.session.scalars(statement)).one()
         await self.session.commit()
-        await self.session.refresh(user)
+        self._remember_email(user)
         return user
 
     async def update(self, user: UP, update_dict: dict[str, Any]) -> UP:
         """
         Asynchronously updates the attributes of a user instance with the provided values.
 
+        When the session keeps its instances loaded on commit (`expire_on_commit=False`) and
+        the dialect supports UPDATE ... RETURNING, the updated row is loaded by the UPDATE
+        itself instead of being refreshed after the commit. That path bypasses the unit of
+        work, so mapper events and `@validates` hooks do not fire for it.
+
         Args:
             user (UP): The user instance to be updated.
             update_dict (dict[str, Any]): A dictionary containing attribute names and their new values.
@@ -181,11 +382,34 @@ class SQLAlchemyUserDatabase(Generic[UP, ID], BaseUserDatabase[UP, ID]):
         Returns:
             UP: The updated user instance after committing and refreshing from the database.
         """
-        for key, value in update_dict.items():
-            setattr(user, key, value)
-        self.session.add(user)
+        update_dict = _lower_email(update_dict)
+        user_id = _identity(user)
+        if "email" in update_dict:
+            self._forget_email(user_id)
+        connection = await self.session.connection()
+        if (
+            not update_dict
+            or self.session.sync_session.expire_on_commit
+            or not connection.dialect.update_returning
+        ):
+            for key, value in update_dict.items():
+                setattr(user, key, value)
+            self.session.add(user)
+            await self.session.commit()
+            await self.session.refresh(user)
+            self._remember_email(user)
+            return user
+
+        statement = (
+            update(self.user_table)
+            .where(self.user_table.id == user_id)
+            .values(**_pack_flags(update_dict, self.user_table.flags))
+            .returning(self.user_table)
+            .execution_options(populate_existing=True)
+        )
+        user = (await self.session.scalars(statement)).one()
         await self.session.commit()
-        await self.session.refresh(user)
+        self._remember_email(user)
         return user
 
     async def delete(self, user: UP) -> None:
@@ -198,18 +422,370 @@ class SQLAlchemyUserDatabase(Generic[UP, ID], BaseUserDatabase[UP, ID]):
         Returns:
             None
         """
+        self._forget_email(_identity(user))
         await self.session.delete(user)
         await self.session.commit()
 
-    async def _get_user(self, statement: Select) -> UP | None:
+    async def create_many(self, create_dicts: list[dict[str, Any]]) -> list[UP]:
+        """
+        Asynchronously creates several user records in a single transaction.
+
+        On dialects supporting executemany INSERT ... RETURNING the rows are sent with one
+        bulk statement, which SQLAlchemy batches through "insertmanyvalues" instead of
+        flushing and refreshing every user. Elsewhere the users are added to the session and
+        flushed together.
+
+        Args:
+            create_dicts (list[dict[str, Any]]): A list of dictionaries, one per user to create.
+
+        Returns:
+            list[UP]: The newly created user instances, in the same order as `create_dicts`.
+        """
+        if not create_dicts:
+            return []
+        connection = await self.session.connection()
+        if not connection.dialect.insert_executemany_returning:
+            users = [
+                self.user_table(**_lower_email(create_dict)) for create_dict in create_dicts
+            ]
+            self.session.add_all(users)
+            await self.session.flush()
+            await self._commit_returned(users)
+            return users
+
+        statement = (
+            insert(self.user_table)
+            .returning(self.user_table, sort_by_parameter_order=True)
+            .execution_options(
+                populate_existing=True,
+                insertmanyvalues_page_size=BULK_PAGE_SIZE,
+            )
+        )
+        results = await self.session.scalars(
+            statement,
+            [
+                _pack_flags(_lower_email(create_dict), USER_FLAGS_DEFAULT)
+                for create_dict in create_dicts
+            ],
+        )
+        users = list(results.all())
+        await self._commit_returned(users)
+        return users
+
+    async def update_many(self, update_dicts: list[dict[str, Any]]) -> None:
+        """
+        Asynchronously updates several user records in a single transaction.
+
+        Each dictionary must include the user's primary key ("id") alongside the attributes
+        to update. The rows are sent as one executemany UPDATE; user instances already loaded
+        in the session are not refreshed. Changes to `is_active`, `is_superuser` and
+        `is_verified` are applied to the packed `flags` column by a second executemany UPDATE
+        that sets and clears the bits in SQL, so the current flags never need to be read.
+
+        Args:
+            update_dicts (list[dict[str, Any]]): A list of dictionaries, one per user to update.
+
+        Returns:
+            None
+        """
+        if not update_dicts:
+            return
+        column_rows = []
+        flag_rows = []
+        for update_dict in update_dicts:
+            mask, bits = _flag_bits(update_dict)
+            values = {
+                key: value
+                for key, value in _lower_email(update_dict).items()
+                if key not in _USER_FLAG_BITS
+            }
+            if mask:
+                flag_rows.append({"b_id": values["id"], "b_keep": ~mask, "b_set": bits})
+            if len(values) > 1:
+                column_rows.append(values)
+
+        if column_rows:
+            await self.session.execute(update(self.user_table), column_rows)
+        if flag_rows:
+            table = self.user_table.__table__
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    flags=table.c.flags.op("&")(bindparam("b_keep")).op("|")(
+                        bindparam("b_set")
+                    )
+                )
+            )
+            await self.session.execute(statement, flag_rows)
+        await self.session.commit()
+        # Emails may have changed, forget them rather than tracking each row
+        self._email_index.clear()
+
+    async def delete_many(self, user_ids: list[ID]) -> None:
+        """
+        Asynchronously deletes several user records in a single transaction.
+
+        Args:
+            user_ids (list[ID]): The unique identifiers of the users to delete.
+
+        Returns:
+            None
+        """
+        if not user_ids:
+            return
+        await self.session.execute(
+            delete(self.user_table).where(self.user_table.id.in_(user_ids))
+        )
+        await self.session.commit()
+        self._email_index.clear()
+
+    async def copy_from(self, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Asynchronously bulk loads user records, using PostgreSQL COPY when available.
+
+        On PostgreSQL with the asyncpg driver the records are collected and sent with
+        `copy_records_to_table`, the fastest ingest path for seeds and migrations. This
+        bypasses the ORM unit of work entirely: no user instances are created, no ORM events
+        fire and Python-side column defaults are computed here rather than by SQLAlchemy.
+        Columns missing from a record and without a Python-side default are left out of the
+        COPY so their server defaults apply; records are grouped by the columns they fill and
+        each group is sent with its own COPY. The load is all-or-nothing: the COPYs run in
+        one asyncpg transaction, a savepoint when the session's transaction has already begun,
+        so a failing group leaves no rows of the other groups behind. On any other dialect or
+        driver the records are delegated to `create_many`.
+
+        Args:
+            records (Iterable[dict[str, Any]]): The fields and values of each user to load.
+
+        Returns:
+            int: The number of user records loaded.
+        """
+        connection = await self.session.connection()
+        dialect = connection.dialect
+        if dialect.name != "postgresql" or dialect.driver != "asyncpg":
+            return len(await self.create_many(list(records)))
+
+        table = self.user_table.__table__
+        defaulted = {
+            column.key for column in table.columns if _has_python_default(column)
+        }
+        groups: dict[tuple[Column, ...], list[tuple[Any, ...]]] = {}
+        for record in records:
+            record = _pack_flags(_lower_email(record), USER_FLAGS_DEFAULT)
+            columns = tuple(
+                column
+                for column in table.columns
+                if column.key in record or column.key in defaulted
+            )
+            groups.setdefault(columns, []).append(
+                tuple(
+                    record[column.key]
+                    if column.key in record
+                    else _column_default(column)
+                    for column in columns
+                )
+            )
+        if not groups:
+            return 0
+
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        # SQLAlchemy's asyncpg adapter only begins its transaction on the first statement, so
+        # without this block every COPY would autocommit on its own
+        async with driver_connection.transaction():
+            for columns, rows in groups.items():
+                await driver_connection.copy_records_to_table(
+                    table.name,
+                    records=rows,
+                    columns=[column.name for column in columns],
+                    schema_name=table.schema,
+                )
+        await self.session.commit()
+        return sum(len(rows) for rows in groups.values())
+
+    async def _commit_returned(self, users: list[UP]) -> None:
+        """
+        Asynchronously commits user rows that were just written.
+
+        The written rows are already loaded, so they are only reloaded when the session
+        expires its instances on commit and the loaded attributes would be discarded. The
+        users are then reloaded with one SELECT per BULK_PAGE_SIZE users, which keeps every
+        query well under the bound parameter limits of the drivers.
+
+        Args:
+            users (list[UP]): The written user instances, flushed or loaded from RETURNING.
+
+        Returns:
+            None
+        """
+        user_ids = [user.id for user in users]
+        await self.session.commit()
+        if not self.session.sync_session.expire_on_commit:
+            return
+        for start in range(0, len(user_ids), BULK_PAGE_SIZE):
+            statement = (
+                select(self.user_table)
+                .where(self.user_table.id.in_(user_ids[start : start + BULK_PAGE_SIZE]))
+                .execution_options(populate_existing=True)
+            )
+            (await self.session.scalars(statement)).all()
+
+    def _remember_email(self, user: UP) -> None:
+        """
+        Records the user's identifier under their lowercased email address.
+
+        The index lives as long as this instance, which is normally scoped to a single session,
+        so it cannot grow without bound.
+
+        Args:
+            user (UP): The user instance that was looked up or written.
+
+        Returns:
+            None
+        """
+        self._email_index[user.email.lower()] = user.id
+
+    def _forget_email(self, user_id: ID) -> None:
+        """
+        Removes the email index entry of a user.
+
+        Args:
+            user_id (ID): The unique identifier of the user.
+
+        Returns:
+            None
+        """
+        for email, indexed_id in list(self._email_index.items()):
+            if indexed_id == user_id:
+                del self._email_index[email]
+
+    async def _get_user(
+        self, statement: Executable, params: dict[str, Any] | None = None
+    ) -> UP | None:
         """
-        Asynchronously executes the provided SQLAlchemy Select statement to retrieve a single unique user.
+        Asynchronously executes the provided SQLAlchemy select statement to retrieve a single user.
+
+        The statements used here do not eager-load collections with joins, so rows are never
+        duplicated and the result does not need to be uniqued.
 
         Args:
-            statement (Select): The SQLAlchemy Select statement used to query the user.
+            statement (Executable): The SQLAlchemy select statement used to query the user.
+            params (dict[str, Any] | None): Values for the statement's bound parameters.
 
         Returns:
             UP | None: The user object if found, otherwise None.
         """
-        results = await self.session.execute(statement)
-        return results.unique().scalar_one_or_none()
+        results = await self.session.execute(statement, params)
+        return results.scalar_one_or_none()
+
+
+def _identity(user: Any) -> Any:
+    """
+    Returns the primary key of a user instance without loading any of its attributes.
+
+    Instances expired by a commit would otherwise emit a lazy load, which is not allowed
+    outside of the asynchronous session's own calls.
+
+    Args:
+        user (Any): The user instance.
+
+    Returns:
+        Any: The user's primary key.
+    """
+    identity = inspect(user).identity
+    if identity is None:
+        return user.id
+    return identity[0]
+
+
+def _lower_email(values: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the given user values with the email address lowercased.
+
+    Args:
+        values (dict[str, Any]): The user fields and values about to be written.
+
+    Returns:
+        dict[str, Any]: A copy of `values` with a lowercased "email", or `values` itself if it
+        has no email.
+    """
+    email = values.get("email")
+    if email is None:
+        return values
+    return {**values, "email": email.lower()}
+
+
+def _flag_bits(values: dict[str, Any]) -> tuple[int, int]:
+    """
+    Collects the `flags` bits targeted by the boolean flag keys of the given user values.
+
+    Args:
+        values (dict[str, Any]): The user fields and values about to be written.
+
+    Returns:
+        tuple[int, int]: The mask of the bits being written and the bits among them being set.
+    """
+    mask = bits = 0
+    for key, bit in _USER_FLAG_BITS.items():
+        if key in values:
+            mask |= bit
+            if values[key]:
+                bits |= bit
+    return mask, bits
+
+
+def _pack_flags(values: dict[str, Any], flags: Any) -> dict[str, Any]:
+    """
+    Returns the given user values with the boolean flag keys folded into the `flags` column.
+
+    Args:
+        values (dict[str, Any]): The user fields and values about to be written.
+        flags (Any): The flags to apply the values on, either an int or a SQL expression such as
+            the `flags` column itself. An explicit "flags" value takes precedence.
+
+    Returns:
+        dict[str, Any]: A copy of `values` with "is_active", "is_superuser" and "is_verified"
+        replaced by "flags", or `values` itself if it has none of them.
+    """
+    mask, bits = _flag_bits(values)
+    if not mask:
+        return values
+    values = {key: value for key, value in values.items() if key not in _USER_FLAG_BITS}
+    flags = values.get("flags", flags)
+    if isinstance(flags, int):
+        values["flags"] = flags & ~mask | bits
+    else:
+        values["flags"] = flags.op("&")(~mask).op("|")(bits)
+    return values
+
+
+def _has_python_default(column: Column) -> bool:
+    """
+    Tells whether a column has a scalar or callable default computed on the Python side.
+
+    Args:
+        column (Column): The table column to check.
+
+    Returns:
+        bool: True if `_column_default` can compute the column's default, False otherwise.
+    """
+    default = column.default
+    return default is not None and (default.is_scalar or default.is_callable)
+
+
+def _column_default(column: Column) -> Any:
+    """
+    Computes the Python-side default of a column for rows written outside the ORM.
+
+    Args:
+        column (Column): The table column whose default should be computed, which must
+            satisfy `_has_python_default`.
+
+    Returns:
+        Any: The scalar default or the result of a callable default.
+    """
+    default = column.default
+    if default.is_callable:
+        return default.arg(None)
+    return default.arg
@@ -0,0 +1,54 @@
+from typing import Any
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+
+def create_async_user_engine(
+    url: str | URL,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_recycle: int = 3600,
+    pool_pre_ping: bool = False,
+    **kwargs: Any,
+) -> AsyncEngine:
+    """
+    Creates an asynchronous SQLAlchemy engine configured for serving user lookups.
+
+    Sessions passed to `SQLAlchemyUserDatabase` are usually bound to an engine with the
+    default pool settings, which keeps few idle connections around, so bursts of
+    authentication requests pay for new TCP (and TLS) handshakes. This engine keeps a
+    larger pool of persistent connections instead:
+
+    - `pool_size` connections stay open, with up to `max_overflow` extra ones under load.
+    - Connections are recycled after `pool_recycle` seconds, before servers or proxies
+      drop them for being idle.
+    - `pool_pre_ping` is disabled so checking a connection out of the pool does not cost
+      an extra round-trip; enable it if connections are dropped more often than
+      `pool_recycle`.
+
+    Plain `postgresql://` URLs are switched to the asyncpg driver.
+
+    Args:
+        url (str | URL): The database URL.
+        pool_size (int, optional): The number of connections kept open in the pool. Defaults to 20.
+        max_overflow (int, optional): The number of connections allowed beyond `pool_size`. Defaults to 10.
+        pool_recycle (int, optional): The number of seconds after which a connection is replaced. Defaults to 3600.
+        pool_pre_ping (bool, optional): Whether to test connections when checking them out. Defaults to False.
+        **kwargs: Additional keyword arguments passed to `create_async_engine`.
+
+    Returns:
+        AsyncEngine: The configured asynchronous engine.
+    """
+    url = make_url(url)
+    if url.drivername == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return create_async_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        **kwargs,
+    )
@@ -1,12 +1,27 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from pydantic import UUID4
 from sqlalchemy import CHAR, TIMESTAMP, TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID
 
 
+def _uuid_to_char(value: Any) -> str:
+    """
+    Converts a UUID, or a string representation of one, to its canonical string form.
+
+    Args:
+        value (Any): A uuid.UUID instance or a string representation of a UUID.
+
+    Returns:
+        str: The canonical 36-character string representation of the UUID.
+    """
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(value)
+    return str(value)
+
+
 class GUID(TypeDecorator):
     """
     A SQLAlchemy custom type decorator for handling UUIDs across different database backends.
@@ -42,6 +57,9 @@ class GUID(TypeDecorator):
     impl = UUIDChar
     cache_ok = True
 
+    # Converts a non-None bound value for the dialect in use, set by load_dialect_impl
+    _bind: Optional[Callable[[Any], str]] = None
+
     def load_dialect_impl(self, dialect):
         """
         Provides the appropriate SQLAlchemy type descriptor for the current database dialect.
@@ -56,13 +74,19 @@ class GUID(TypeDecorator):
             A type descriptor suitable for the specified dialect.
         """
         if dialect.name == "postgresql":
+            self._bind = str
             return dialect.type_descriptor(UUID())
+        self._bind = _uuid_to_char
         return dialect.type_descriptor(CHAR(36))
 
     def process_bind_param(self, value, dialect):
         """
         Processes the value before it is sent to the database.
 
+        The dialect-specific conversion is picked once by `load_dialect_impl`, so binding a
+        value is a single call instead of re-checking the dialect and value type every time.
+        It is picked here from the dialect when the type is used before `load_dialect_impl`.
+
         Parameters:
             value (Any): The value to be processed, typically a UUID or a string representation of a UUID.
             dialect (Dialect): The SQLAlchemy dialect in use, which determines database-specific behavior.
@@ -78,16 +102,18 @@ class GUID(TypeDecorator):
         """
         if value is None:
             return value
-        if dialect.name == "postgresql":
-            return str(value)
-        if not isinstance(value, uuid.UUID):
-            return str(uuid.UUID(value))
-        return str(value)
+        bind = self._bind
+        if bind is None:
+            bind = str if dialect.name == "postgresql" else _uuid_to_char
+        return bind(value)
 
-    def process_result_value(self, value):
+    def process_result_value(self, value, dialect):
         """
         Processes the value returned from the database before passing it to the application.
 
+        PostgreSQL drivers already return uuid.UUID instances for the native UUID type, so the
+        value is passed through untouched there.
+
         Args:
             value: The value fetched from the database.
             dialect: The database dialect in use.
@@ -95,7 +121,7 @@ class GUID(TypeDecorator):
         Returns:
             The processed value, converted to a uuid.UUID instance if necessary, or None if the value is None.
         """
-        if value is None:
+        if value is None or dialect.name == "postgresql":
             return value
         if not isinstance(value, uuid.UUID):
             value = uuid.UUID(value)
@@ -125,18 +151,63 @@ class TIMESTAMPAware(TypeDecorator):
         cache_ok (bool): Indicates this type is safe to cache.
 
     Methods:
+        load_dialect_impl(dialect):
+            Picks the result conversion for the dialect in use.
+        result_processor(dialect, coltype):
+            Skips the Python-level result hook entirely on PostgreSQL.
         process_result_value(value, dialect):
             Ensures the returned datetime is timezone-aware (UTC) unless using PostgreSQL.
     """
     impl = TIMESTAMP
     cache_ok = True
 
+    # Converts a fetched value for the dialect in use, set by load_dialect_impl
+    _postprocess: Optional[Callable[[Optional[datetime]], Optional[datetime]]] = None
+
+    def load_dialect_impl(self, dialect):
+        """
+        Provides the type descriptor for the current dialect and picks its result conversion.
+
+        PostgreSQL values are returned untouched, other dialects get UTC timezone info attached.
+
+        Args:
+            dialect: The SQLAlchemy dialect in use.
+
+        Returns:
+            The underlying TIMESTAMP type descriptor.
+        """
+        if dialect.name == "postgresql":
+            self._postprocess = _as_is
+        else:
+            self._postprocess = _as_utc
+        return super().load_dialect_impl(dialect)
+
+    def result_processor(self, dialect, coltype):
+        """
+        Provides the result processing function for the given dialect.
+
+        On PostgreSQL the values need no conversion, so only the processor of the underlying
+        TIMESTAMP type is returned and no Python-level call is made per fetched row. Other
+        dialects go through `process_result_value` as usual.
+
+        Args:
+            dialect: The SQLAlchemy dialect in use.
+            coltype: The DBAPI column type of the result.
+
+        Returns:
+            The result processing callable, or None if no processing is needed.
+        """
+        if dialect.name == "postgresql":
+            return self.impl_instance.result_processor(dialect, coltype)
+        return super().result_processor(dialect, coltype)
+
     def process_result_value(self, value: Optional[datetime], dialect):
         """
         Processes the result value retrieved from the database, ensuring timezone awareness for non-PostgreSQL dialects.
 
-        If the value is not None and the database dialect is not PostgreSQL, the method sets the timezone information to UTC.
-        Otherwise, it returns the value as is.
+        If the value is not None and the database dialect is not PostgreSQL, the timezone information is set to UTC.
+        Otherwise, the value is returned as is. The conversion is picked once by `load_dialect_impl`,
+        or here from the dialect when the type is used before it.
 
         Args:
             value (Optional[datetime]): The datetime value retrieved from the database.
@@ -145,6 +216,35 @@ class TIMESTAMPAware(TypeDecorator):
         Returns:
             Optional[datetime]: The processed datetime value with UTC timezone info if applicable, or the original value.
         """
-        if value is not None and dialect.name != "postgresql":
-            return value.replace(tzinfo=timezone.utc)
+        postprocess = self._postprocess
+        if postprocess is None:
+            postprocess = _as_is if dialect.name == "postgresql" else _as_utc
+        return postprocess(value)
+
+
+def _as_is(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Returns the fetched datetime value unchanged.
+
+    Args:
+        value (Optional[datetime]): The datetime value retrieved from the database.
+
+    Returns:
+        Optional[datetime]: The same value.
+    """
+    return value
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Attaches UTC timezone info to a fetched naive datetime value.
+
+    Args:
+        value (Optional[datetime]): The datetime value retrieved from the database.
+
+    Returns:
+        Optional[datetime]: The value with UTC timezone info, or None if the value is None.
+    """
+    if value is None:
         return value
+    return value.replace(tzinfo=timezone.utc)
@@ -1,36 +1,530 @@
+import binascii
+import hmac
 import os
+import sys
+import time
 import jwt
 
-from typing import Any, Union
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+
+from typing import Any, Callable, Sequence, Union
+from datetime import timedelta
 from pydantic import SecretStr
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+# Interned, so that algorithm names read from the environment can be matched by identity
+_HS256 = sys.intern("HS256")
+SUPPORTED_ALGORITHMS: frozenset[str] = frozenset({_HS256})
+
+# Default for the algorithm and secret arguments, resolved from the environment on first use
+_UNSET: Any = object()
+
+# Clock skew tolerated when validating the time-based claims of a token
+DECODE_LEEWAY_SECONDS = 5
+# Upper bound on the number of decoded payloads kept by decode_jwt
+DECODE_CACHE_MAXSIZE = 10_000
+
+# PyJWT decode options, indexed by whether the 'scopes' claim is required
+_DECODE_OPTIONS: dict[bool, dict[str, Any]] = {
+    False: {
+        "require": ("exp", "sub", "iat", "nbf"),
+        "verify_exp": True,
+        "verify_iat": True,
+        "verify_nbf": True,
+    },
+    True: {
+        "require": ("exp", "sub", "iat", "nbf", "scopes"),
+        "verify_exp": True,
+        "verify_iat": True,
+        "verify_nbf": True,
+    },
+}
+
+# Verified tokens keyed by a keyed hash of the token, plus the decoding options, in least
+# recently used order. Each entry holds the token expiration time; the payload itself is
+# parsed again from the token on every hit, so callers never share mutable claim values.
+_DECODE_CACHE: OrderedDict[tuple[bytes, tuple[str, ...], bool], int] = OrderedDict()
+
+SecretType = Union[str, bytes, SecretStr]
+
+
+@lru_cache(maxsize=1)
+def _env_algorithm() -> tuple[str, bool]:
+    """
+    Read the default JWT algorithm from the JWT_ALGORITHM environment variable.
+
+    The variable is read, and the algorithm validated, once on first use rather than at
+    import, so it can still be set after this module is imported.
+
+    Returns:
+        tuple[str, bool]: The algorithm, defaulting to HS256, and whether it is supported.
+    """
+    algorithm = sys.intern(os.environ.get("JWT_ALGORITHM", _HS256))
+    return algorithm, algorithm in SUPPORTED_ALGORITHMS
+
+
+@lru_cache(maxsize=1)
+def _env_algorithms() -> tuple[str, ...]:
+    """
+    Build the default list of algorithms accepted for decoding, once.
+
+    Returns:
+        tuple[str, ...]: The algorithm read by `_env_algorithm`, as the only accepted one.
+    """
+    return (_env_algorithm()[0],)
 
-JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM", "HS256")
-JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY")
-SUPPORTED_ALGORITHMS = {"HS256"}
 
-SecretType = Union[str, SecretStr]
+@lru_cache(maxsize=1)
+def _env_secret() -> bytes | None:
+    """
+    Read the default JWT secret from the JWT_SECRET_KEY environment variable.
+
+    The variable is read, and encoded, once on first use rather than at import, so it can
+    still be set after this module is imported.
+
+    Returns:
+        bytes | None: The UTF-8 encoded secret, or None if the variable is not set.
+    """
+    secret = os.environ.get("JWT_SECRET_KEY")
+    return secret.encode("utf-8") if secret is not None else None
 
 
-def _get_secret_value(secret: SecretType) -> str:
+def _get_secret_value(secret: SecretType | None) -> bytes | None:
     """
-    Retrieve the string value from a secret.
+    Retrieve the UTF-8 encoded value of a secret.
 
     If the provided secret is an instance of SecretStr, its value is extracted using
-    the `get_secret_value()` method. Otherwise, the secret is returned as-is.
+    the `get_secret_value()` method. Strings are encoded to bytes and bytes are returned
+    as-is. The unset default resolves to the JWT_SECRET_KEY environment variable.
 
     Args:
-        secret (SecretType): The secret value, which can be a string or a SecretStr instance.
+        secret (SecretType | None): The secret value, which can be a string, bytes or a SecretStr instance.
 
     Returns:
-        str: The underlying string value of the secret.
+        bytes | None: The underlying value of the secret, as bytes, or None if no secret is available.
     """
+    if secret is _UNSET:
+        return _env_secret()
+    if secret is None:
+        return None
+    # Exact types are resolved with a single dict lookup, subclasses fall back to isinstance
+    to_bytes = _SECRET_TO_BYTES.get(type(secret))
+    if to_bytes is not None:
+        return to_bytes(secret)
     if isinstance(secret, SecretStr):
-        return secret.get_secret_value()
+        secret = secret.get_secret_value()
+    if isinstance(secret, str):
+        return secret.encode("utf-8")
     return secret
 
 
+# The SecretStr instance unwrapped last, with its encoded value
+_last_secret_str: tuple[SecretStr | None, bytes] = (None, b"")
+
+
+def _secret_str_to_bytes(secret: SecretStr) -> bytes:
+    """
+    Unwrap and encode a SecretStr, reusing the previous result for the same instance.
+
+    Services usually hold a single configuration-level SecretStr and pass it on every call,
+    so remembering the last instance avoids the unwrap and the encoding, and hands back the
+    same bytes object, whose hash is already computed for the key caches.
+
+    Args:
+        secret (SecretStr): The secret to unwrap.
+
+    Returns:
+        bytes: The UTF-8 encoded secret value.
+    """
+    global _last_secret_str
+    last_secret, last_value = _last_secret_str
+    if secret is last_secret:
+        return last_value
+    value = secret.get_secret_value().encode("utf-8")
+    _last_secret_str = (secret, value)
+    return value
+
+
+# Conversions to bytes for each of the exact types accepted as a secret
+_SECRET_TO_BYTES: dict[type, Callable[[Any], bytes]] = {
+    str: str.encode,
+    bytes: bytes.__bytes__,
+    SecretStr: _secret_str_to_bytes,
+}
+
+
+class _OrjsonPyJWT(jwt.PyJWT):
+    """
+    PyJWT codec that serializes and parses token payloads with orjson.
+
+    orjson produces compact UTF-8 bytes directly, matching the separators PyJWT uses, and
+    parses small payloads several times faster than the standard library json module.
+    """
+
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: dict[str, Any] | None = None,
+        json_encoder: type | None = None,
+    ) -> bytes:
+        if json_encoder is not None:
+            return super()._encode_payload(payload, headers, json_encoder)
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+# Shared PyJWT instance, using orjson for payloads when it is installed
+_JWT = _OrjsonPyJWT() if orjson is not None else jwt.PyJWT()
+
+# Signing algorithm objects for SUPPORTED_ALGORITHMS, resolved once instead of per token
+_ALGORITHMS: dict[str, jwt.algorithms.Algorithm] = {
+    "HS256": jwt.algorithms.HMACAlgorithm(jwt.algorithms.HMACAlgorithm.SHA256),
+}
+
+
+@lru_cache(maxsize=32)
+def _get_key(secret_value: bytes, algorithm: str) -> bytes:
+    """
+    Prepare the signing key for a secret once and reuse it for every token signed with it.
+
+    Unlike the decode cache, this cache holds the raw secrets of the 32 most recently used
+    keys, and for HMAC the prepared keys are the secrets themselves. Hashing the secrets in
+    the cache key would not help, as the key must be derived from the secret anyway.
+
+    Args:
+        secret_value (bytes): The secret the tokens are signed with.
+        algorithm (str): The signing algorithm, one of SUPPORTED_ALGORITHMS.
+
+    Returns:
+        bytes: The key, as normalized by the algorithm.
+    """
+    return _ALGORITHMS[algorithm].prepare_key(secret_value)
+
+
+def _sign_hs256(signing_input: bytes, key: bytes) -> bytes:
+    """
+    Compute the HMAC-SHA256 signature of a token.
+
+    `hmac.digest` is a one-shot OpenSSL call, it skips creating the Python `hmac.HMAC`
+    object that `HMACAlgorithm.sign` builds for every token.
+
+    Args:
+        signing_input (bytes): The encoded header and payload, joined by a dot.
+        key (bytes): The prepared signing key.
+
+    Returns:
+        bytes: The raw signature.
+    """
+    return hmac.digest(key, signing_input, "sha256")
+
+
+# Signature functions for SUPPORTED_ALGORITHMS
+_SIGNERS: dict[str, Callable[[bytes, bytes], bytes]] = {
+    "HS256": _sign_hs256,
+}
+# Claims set by create_jwt and create_jwts, replacing any value given by the caller
+_TIME_CLAIMS = frozenset({"iat", "exp", "nbf"})
+# HMAC digest names for SUPPORTED_ALGORITHMS
+_HMAC_DIGESTS: dict[str, str] = {
+    "HS256": "sha256",
+}
+
+# Translation from the standard base64 alphabet to the URL-safe one
+_B64URL_ALPHABET = bytes.maketrans(b"+/", b"-_")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """
+    Base64url encode data without padding, as JWT segments are.
+
+    This is `jwt.utils.base64url_encode` without the `base64` module wrappers: the C
+    encoder is called directly and its output translated to the URL-safe alphabet.
+
+    Args:
+        data (bytes): The data to encode.
+
+    Returns:
+        bytes: The unpadded base64url encoding of the data.
+    """
+    encoded = binascii.b2a_base64(data, newline=False)
+    return encoded.translate(_B64URL_ALPHABET).rstrip(b"=")
+
+
+# Base64url encoded JWT header for each of SUPPORTED_ALGORITHMS, followed by the segment
+# separator, so it does not need serializing again for every token
+_HEADER_HS256 = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}') + b"."
+_HEADERS: dict[str, bytes] = {
+    "HS256": _HEADER_HS256,
+}
+
+
+def _encode_jwt(payload: dict[str, Any], secret_value: bytes, algorithm: str) -> str:
+    """
+    Encode and sign a JWT without going through the generic PyJWS pipeline.
+
+    PyJWS resolves the algorithm, builds the header and normalizes the key on every call;
+    here the encoded header and the prepared key are looked up instead.
+
+    Args:
+        payload (dict[str, Any]): The complete token payload.
+        secret_value (bytes): The secret the token is signed with.
+        algorithm (str): The signing algorithm, one of SUPPORTED_ALGORITHMS.
+
+    Returns:
+        str: The encoded JWT.
+    """
+    signing_input = _HEADERS[algorithm] + _b64url_encode(
+        _JWT._encode_payload(payload)
+    )
+    signature = _SIGNERS[algorithm](signing_input, _get_key(secret_value, algorithm))
+    return (signing_input + b"." + _b64url_encode(signature)).decode()
+
+
+def _decode_fast(
+    token: bytes,
+    secret_value: bytes,
+    algorithms: Sequence[str],
+    required_claims: tuple[str, ...],
+    macs: dict[str, hmac.HMAC] | None = None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Verify and decode a well-formed token without going through the generic PyJWT pipeline.
+
+    Only tokens carrying one of the headers this module produces, with a valid signature
+    and integer time claims, are handled here; an expired token is reported directly, as
+    it is the common failure. Anything else is left to PyJWT, which reports the appropriate
+    error, so the set of accepted tokens and the errors reported are the same as with
+    PyJWT alone.
+
+    Args:
+        token (bytes): The encoded JWT.
+        secret_value (bytes): The secret the token is verified with.
+        algorithms (Sequence[str]): The algorithms accepted for decoding.
+        required_claims (tuple[str, ...]): The claims that must be present in the payload.
+        macs (dict[str, hmac.HMAC] | None, optional): HMAC states already keyed with the
+            secret, by algorithm, copied instead of keying a new one. Defaults to None.
+
+    Returns:
+        tuple[dict[str, Any] | None, str | None]: The verified payload and None, None and
+            the JWTError message for an expired token, or None and None if PyJWT must
+            handle the token.
+    """
+    for algorithm in algorithms:
+        header = _HEADERS.get(algorithm)
+        if header is not None and token.startswith(header):
+            break
+    else:
+        return None, None
+
+    signing_input, _, signature_b64 = token.rpartition(b".")
+    payload_b64 = signing_input[len(header) :]
+    mac = macs.get(algorithm) if macs else None
+    if mac is not None:
+        mac = mac.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+    else:
+        signature = _SIGNERS[algorithm](signing_input, _get_key(secret_value, algorithm))
+    if b"." in payload_b64 or not hmac.compare_digest(
+        signature_b64, _b64url_encode(signature)
+    ):
+        return None, None
+
+    try:
+        payload = _JWT._decode_payload(
+            {"payload": jwt.utils.base64url_decode(payload_b64)}
+        )
+    except (ValueError, jwt.DecodeError):
+        return None, None
+
+    for claim in required_claims:
+        if payload.get(claim) is None:
+            return None, None
+    iat, nbf, exp = payload.get("iat"), payload.get("nbf"), payload.get("exp")
+    if type(iat) is not int or type(nbf) is not int or type(exp) is not int:
+        return None, None
+    now = time.time()
+    if iat > now + DECODE_LEEWAY_SECONDS or nbf > now + DECODE_LEEWAY_SECONDS:
+        return None, None
+    # PyJWT checks the expiration time right after iat and nbf
+    if exp <= now - DECODE_LEEWAY_SECONDS:
+        return None, _EXPIRED_MESSAGE
+    # PyJWT rejects a non-string subject or token ID, and any audience since none is expected
+    if type(payload.get("sub", "")) is not str or type(payload.get("jti", "")) is not str:
+        return None, None
+    if payload.get("aud"):
+        return None, None
+    return payload, None
+
+
+def _decode_cache_key(
+    token: bytes, secret_value: bytes, algorithms: Sequence[str], scopes_required: bool
+) -> tuple[bytes, tuple[str, ...], bool]:
+    """
+    Build the decode cache key for a token.
+
+    The token is hashed with BLAKE2b keyed by the secret, so the decode cache holds neither
+    raw tokens nor secrets and a token only matches entries verified with the same secret.
+    The secrets themselves are still held by the bounded `_get_key` cache.
+
+    Args:
+        token (bytes): The encoded JWT.
+        secret_value (bytes): The secret the token is verified with.
+        algorithms (Sequence[str]): The algorithms accepted for decoding.
+        scopes_required (bool): Whether the 'scopes' claim is required.
+
+    Returns:
+        tuple[bytes, tuple[str, ...], bool]: The cache key.
+    """
+    key = secret_value
+    # BLAKE2b keys are limited to 64 bytes, longer secrets are hashed down first
+    if len(key) > 64:
+        key = blake2b(key).digest()
+    digest = blake2b(token, digest_size=16, key=key).digest()
+    return digest, tuple(algorithms), scopes_required
+
+
+def _payload_from_verified(token: bytes) -> dict[str, Any]:
+    """
+    Parse the payload of a token whose signature and claims were already verified.
+
+    A new payload is built on every call, nested claim values such as the scopes list
+    included, so a caller modifying it cannot affect later decodes of the same token.
+
+    Args:
+        token (bytes): The encoded JWT, as verified by `_decode_no_raise`.
+
+    Returns:
+        dict[str, Any]: The token payload.
+    """
+    signing_input = token.rpartition(b".")[0]
+    payload_b64 = signing_input.partition(b".")[2]
+    return _JWT._decode_payload({"payload": jwt.utils.base64url_decode(payload_b64)})
+
+
+def _store_decoded(
+    cache_key: tuple[bytes, tuple[str, ...], bool], payload: dict[str, Any]
+) -> None:
+    """
+    Store a verified token in the decode cache, evicting entries when it is full.
+
+    The least recently used entries are evicted until there is room for the new one, which
+    takes constant time however large the cache is. Expired entries are not scanned for:
+    they are dropped when they are next hit, or reach the end of the LRU order and are
+    evicted like any other entry.
+
+    Args:
+        cache_key (tuple[bytes, tuple[str, ...], bool]): The key built by `_decode_cache_key`.
+        payload (dict[str, Any]): The verified payload, which must include an "exp" claim.
+    """
+    while len(_DECODE_CACHE) >= DECODE_CACHE_MAXSIZE:
+        try:
+            _DECODE_CACHE.popitem(last=False)
+        except KeyError:
+            # Emptied concurrently, or a zero maximum size
+            break
+    _DECODE_CACHE[cache_key] = int(payload["exp"])
+
+
+# JWTError messages for the PyJWT errors raised while decoding, most specific first
+_DECODE_ERROR_MESSAGES: dict[type[jwt.InvalidTokenError], Callable[[Any], str]] = {
+    jwt.MissingRequiredClaimError: lambda err: f"Missing claims: {err.claim}",
+    jwt.ExpiredSignatureError: lambda err: "JWT has expired.",
+    jwt.InvalidIssuedAtError: lambda err: "JWT issue time (iat) is invalid or not an integer.",
+    jwt.ImmatureSignatureError: lambda err: "JWT is not yet valid (nbf claim).",
+    jwt.InvalidTokenError: lambda err: "Invalid JWT, unable to decode token.",
+}
+
+
+def _decode_error_message(err: jwt.InvalidTokenError) -> str:
+    """
+    Build the JWTError message for an error raised by PyJWT while decoding.
+
+    PyJWT raises the exact exception classes listed in `_DECODE_ERROR_MESSAGES`, so the
+    message is normally found with a single dict lookup on the exception type; subclasses
+    fall back to the first matching entry.
+
+    Args:
+        err (jwt.InvalidTokenError): The error raised by PyJWT.
+
+    Returns:
+        str: The message for the JWTError raised to the caller.
+    """
+    format_message = _DECODE_ERROR_MESSAGES.get(type(err))
+    if format_message is None:
+        format_message = next(
+            message
+            for error_type, message in _DECODE_ERROR_MESSAGES.items()
+            if isinstance(err, error_type)
+        )
+    return format_message(err)
+
+
+# JWTError message for an expired token, reported without going through PyJWT
+_EXPIRED_MESSAGE = _DECODE_ERROR_MESSAGES[jwt.ExpiredSignatureError](None)
+# JWTError message for a token that is neither a str nor bytes, as PyJWT reports it
+_UNDECODABLE_MESSAGE = _DECODE_ERROR_MESSAGES[jwt.InvalidTokenError](None)
+
+
+def _decode_no_raise(
+    token: bytes,
+    secret_value: bytes,
+    algorithms: Sequence[str],
+    options: dict[str, Any],
+    macs: dict[str, hmac.HMAC] | None = None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Verify and decode a token, reporting a failure as a message rather than an exception.
+
+    Well-formed tokens, and expired ones, are handled by `_decode_fast` without raising at
+    all; only the remaining invalid tokens go through PyJWT's exceptions, which are caught
+    here. The caller decides whether to raise.
+
+    Args:
+        token (bytes): The encoded JWT.
+        secret_value (bytes): The secret the token is verified with.
+        algorithms (Sequence[str]): The algorithms accepted for decoding.
+        options (dict[str, Any]): The PyJWT decode options, from `_DECODE_OPTIONS`.
+        macs (dict[str, hmac.HMAC] | None, optional): Keyed HMAC states passed on to
+            `_decode_fast`. Defaults to None.
+
+    Returns:
+        tuple[dict[str, Any] | None, str | None]: The verified payload and None, or None and
+            the JWTError message describing why the token is invalid.
+    """
+    payload, error = _decode_fast(
+        token, secret_value, algorithms, options["require"], macs
+    )
+    if payload is not None or error is not None:
+        return payload, error
+    try:
+        payload = _JWT.decode(
+            token,
+            secret_value,
+            options=options,
+            algorithms=algorithms,
+            leeway=DECODE_LEEWAY_SECONDS,
+        )
+    except jwt.InvalidTokenError as err:
+        return None, _decode_error_message(err)
+    return payload, None
+
+
 class JWTError(ValueError):
     """
     Exception raised for errors related to JSON Web Token (JWT) operations.
@@ -43,11 +537,140 @@ class JWTError(ValueError):
     """
 
 
+def _decode_cached(
+    encoded_jwt: str | bytes,
+    secret_value: bytes,
+    algorithms: Sequence[str],
+    scopes_required: bool,
+    macs: dict[str, hmac.HMAC] | None = None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Decode a token through the decode cache, reporting a failure as a message.
+
+    Verified tokens are cached until they expire, so decoding the same token again
+    with the same secret and options skips signature verification and only re-checks the
+    expiration time.
+
+    Args:
+        encoded_jwt (str | bytes): The encoded JWT to decode. Any other value is reported
+            as an undecodable token.
+        secret_value (bytes): The secret the token is verified with.
+        algorithms (Sequence[str]): The algorithms accepted for decoding.
+        scopes_required (bool): Whether the 'scopes' claim is required.
+        macs (dict[str, hmac.HMAC] | None, optional): Keyed HMAC states passed on to
+            `_decode_fast`. Defaults to None.
+
+    Returns:
+        tuple[dict[str, Any] | None, str | None]: The verified payload and None, or
+            None and the JWTError message describing why the token is invalid.
+    """
+    if isinstance(encoded_jwt, str):
+        token = encoded_jwt.encode()
+    elif isinstance(encoded_jwt, bytes):
+        token = encoded_jwt
+    else:
+        # Such as None from an optional bearer token dependency
+        return None, _UNDECODABLE_MESSAGE
+    cache_key = _decode_cache_key(token, secret_value, algorithms, scopes_required)
+    exp = _DECODE_CACHE.get(cache_key)
+    if exp is not None:
+        # The nbf and iat claims were validated before caching and cannot become invalid
+        # later, only the expiration time needs checking again
+        if exp > time.time() - DECODE_LEEWAY_SECONDS:
+            try:
+                _DECODE_CACHE.move_to_end(cache_key)
+            except KeyError:
+                # Evicted concurrently, the payload is still valid
+                pass
+            return _payload_from_verified(token), None
+        # The token was verified with the same secret and options, it has only expired
+        _DECODE_CACHE.pop(cache_key, None)
+        return None, _EXPIRED_MESSAGE
+
+    payload, error = _decode_no_raise(
+        token, secret_value, algorithms, _DECODE_OPTIONS[scopes_required], macs
+    )
+    if error is not None:
+        return None, error
+
+    _store_decoded(cache_key, payload)
+    return payload, None
+
+
+def _lifetime_seconds(lifetime: timedelta) -> float:
+    """
+    Validate a token lifetime and return it in seconds.
+
+    Args:
+        lifetime (timedelta): The duration for which the JWT will be valid.
+
+    Returns:
+        float: The lifetime, in seconds.
+
+    Raises:
+        JWTError: If the lifetime is not greater than zero.
+    """
+    # Validate the lifetime to ensure it is greater than zero
+    lifetime_seconds = lifetime.total_seconds()
+    if lifetime_seconds <= 0:
+        raise JWTError("Lifetime must be greater than zero.")
+    return lifetime_seconds
+
+
+def _validate_encoding(
+    data: dict,
+    jwt_algorithm: str,
+    jwt_secret: SecretType | None,
+    scopes_required: bool,
+) -> tuple[bytes, str]:
+    """
+    Validate the claims, algorithm and secret a JWT is about to be encoded with.
+
+    Args:
+        data (dict): The payload data to include in the JWT.
+        jwt_algorithm (str): The algorithm to use for encoding the JWT.
+        jwt_secret (SecretType | None): The secret key to use for encoding the JWT.
+        scopes_required (bool): Whether the payload must include a "scopes" claim.
+
+    Returns:
+        tuple[bytes, str]: The secret value to sign with and the resolved algorithm.
+
+    Raises:
+        JWTError: If the secret key is not provided.
+        JWTError: If the specified algorithm is not supported.
+        JWTError: If the payload does not include a "sub" (subject) claim.
+        JWTError: If scopes are required but the payload does not include a "scopes" claim.
+    """
+    # Ensure that the secret key is provided
+    secret_value = _get_secret_value(jwt_secret)
+    if secret_value is None:
+        raise JWTError("JWT secret key must be provided for encoding.")
+
+    # Validate the JWT algorithm, the default one is only checked once
+    if jwt_algorithm is _UNSET:
+        jwt_algorithm, algorithm_supported = _env_algorithm()
+    elif jwt_algorithm is _HS256:
+        algorithm_supported = True
+    else:
+        algorithm_supported = jwt_algorithm in SUPPORTED_ALGORITHMS
+    if not algorithm_supported:
+        raise JWTError(f"Unsupported JWT algorithm: {jwt_algorithm}")
+
+    # Ensure that the payload includes a subject claim
+    if "sub" not in data:
+        raise JWTError('JWT payload must include a "sub" (subject) claim.')
+    # Ensure that the payload includes scopes if required
+    if scopes_required and "scopes" not in data:
+        raise JWTError('JWT payload must include a "scopes" claim.')
+
+    return secret_value, jwt_algorithm
+
+
 def create_jwt(
     data: dict,
     lifetime: timedelta,
-    jwt_algorithm: str = JWT_ALGORITHM,
-    jwt_secret: SecretType | None = JWT_SECRET_KEY,
+    jwt_algorithm: str = _UNSET,
+    jwt_secret: SecretType | None = _UNSET,
     scopes_required: bool = True,
 ) -> str:
     """
@@ -56,8 +679,8 @@ def create_jwt(
     Args:
         data (dict): The payload data to include in the JWT. Must include a "sub" (subject) claim.
         lifetime (timedelta): The duration for which the JWT will be valid.
-        jwt_algorithm (str, optional): The algorithm to use for encoding the JWT. Must be one of SUPPORTED_ALGORITHMS. Defaults to JWT_ALGORITHM.
-        jwt_secret (SecretType | None, optional): The secret key to use for encoding the JWT. Must be provided. Defaults to JWT_SECRET_KEY.
+        jwt_algorithm (str, optional): The algorithm to use for encoding the JWT. Must be one of SUPPORTED_ALGORITHMS. Defaults to the JWT_ALGORITHM environment variable, or HS256.
+        jwt_secret (SecretType | None, optional): The secret key to use for encoding the JWT. Must be provided. Defaults to the JWT_SECRET_KEY environment variable.
         scopes_required (bool, optional): Whether the payload must include a "scopes" claim. Defaults to True.
 
     Returns:
@@ -70,58 +693,121 @@ def create_jwt(
         JWTError: If the payload does not include a "sub" (subject) claim.
         JWTError: If scopes are required but the payload does not include a "scopes" claim.
     """
-    # Validate the lifetime to ensure it is greater than zero
-    if lifetime.total_seconds() <= 0:
-        raise JWTError("Lifetime must be greater than zero.")
-
-    # Ensure that the secret key is provided
-    if jwt_secret is None:
-        raise JWTError("JWT secret key must be provided for encoding.")
-
-    secret_value = _get_secret_value(jwt_secret)
-
-    # Validate the JWT algorithm
-    if jwt_algorithm not in SUPPORTED_ALGORITHMS:
-        raise JWTError(f"Unsupported JWT algorithm: {jwt_algorithm}")
+    lifetime_seconds = _lifetime_seconds(lifetime)
+    secret_value, jwt_algorithm = _validate_encoding(
+        data, jwt_algorithm, jwt_secret, scopes_required
+    )
 
     # Create a JWT payload
     payload = data.copy()
 
-    # Ensure that the payload includes a subject claim
-    if "sub" not in payload:
-        raise JWTError('JWT payload must include a "sub" (subject) claim.')
-    # Ensure that the payload includes scopes if required
-    if scopes_required and "scopes" not in payload:
-        raise JWTError('JWT payload must include a "scopes" claim.')
-
-    # Calculate time now
-    now = datetime.now(timezone.utc)
-    # Calculate the expiration time based on the provided lifetime
-    expire = now + lifetime
+    # Calculate time now, in whole seconds since the epoch
+    now = int(time.time())
     # add the issued at time to the payload
-    payload["iat"] = int(now.timestamp())
+    payload["iat"] = now
     # add the expiration time to the payload
-    payload["exp"] = int(expire.timestamp())
+    payload["exp"] = now + int(lifetime_seconds)
     # add the not before time to the payload
-    payload["nbf"] = int((now - timedelta(seconds=10)).timestamp())
+    payload["nbf"] = now - 10
 
     # Encode the JWT with the provided secret and algorithm
-    return jwt.encode(payload, secret_value, algorithm=jwt_algorithm)
+    return _encode_jwt(payload, secret_value, jwt_algorithm)
+
+
+def create_jwts(
+    data: dict,
+    lifetimes: Sequence[timedelta],
+    jwt_algorithm: str = _UNSET,
+    jwt_secret: SecretType | None = _UNSET,
+    scopes_required: bool = True,
+) -> list[str]:
+    """
+    Create several JSON Web Tokens (JWTs) with the same payload, one per lifetime.
+
+    This is equivalent to calling `create_jwt` once per lifetime, such as when issuing an
+    access and a refresh token together, but the inputs are validated once and the HMAC
+    state for the shared token header is computed once and copied for every token.
+
+    Args:
+        data (dict): The payload data to include in the JWTs. Must include a "sub" (subject) claim.
+        lifetimes (Sequence[timedelta]): The duration for which each JWT will be valid.
+        jwt_algorithm (str, optional): The algorithm to use for encoding the JWTs. Must be one of SUPPORTED_ALGORITHMS. Defaults to the JWT_ALGORITHM environment variable, or HS256.
+        jwt_secret (SecretType | None, optional): The secret key to use for encoding the JWTs. Must be provided. Defaults to the JWT_SECRET_KEY environment variable.
+        scopes_required (bool, optional): Whether the payload must include a "scopes" claim. Defaults to True.
+
+    Returns:
+        list[str]: The encoded JWTs, in the order of `lifetimes`.
+
+    Raises:
+        JWTError: If any of the lifetimes is not greater than zero.
+        JWTError: If the secret key is not provided.
+        JWTError: If the specified algorithm is not supported.
+        JWTError: If the payload does not include a "sub" (subject) claim.
+        JWTError: If scopes are required but the payload does not include a "scopes" claim.
+    """
+    lifetimes_seconds = [_lifetime_seconds(lifetime) for lifetime in lifetimes]
+    secret_value, jwt_algorithm = _validate_encoding(
+        data, jwt_algorithm, jwt_secret, scopes_required
+    )
+
+    header = _HEADERS[jwt_algorithm]
+    header_mac = hmac.new(
+        _get_key(secret_value, jwt_algorithm), header, _HMAC_DIGESTS[jwt_algorithm]
+    )
+
+    payload = data.copy()
+    claims_json = None
+    if orjson is None:
+        # The stdlib json encoder is slow enough that serializing the shared claims once,
+        # without the closing brace, and appending the time claims for each token pays
+        # off; orjson serializes the whole payload faster than the splicing takes
+        claims = {
+            name: value for name, value in data.items() if name not in _TIME_CLAIMS
+        }
+        claims_json = _JWT._encode_payload(claims)[:-1]
+    now = int(time.time())
+    tokens = []
+    for lifetime_seconds in lifetimes_seconds:
+        exp = now + int(lifetime_seconds)
+        if claims_json is not None:
+            payload_json = b'%s,"iat":%d,"exp":%d,"nbf":%d}' % (
+                claims_json,
+                now,
+                exp,
+                now - 10,
+            )
+        else:
+            # Same claims, in the same order, as create_jwt
+            payload["iat"] = now
+            payload["exp"] = exp
+            payload["nbf"] = now - 10
+            payload_json = _JWT._encode_payload(payload)
+        payload_b64 = _b64url_encode(payload_json)
+        mac = header_mac.copy()
+        mac.update(payload_b64)
+        signature_b64 = _b64url_encode(mac.digest())
+        tokens.append((header + payload_b64 + b"." + signature_b64).decode())
+    return tokens
 
 
 def decode_jwt(
-    encoded_jwt: str,
-    jwt_secret: SecretType | None = JWT_SECRET_KEY,
-    algorithms: list[str] | None = None,
+    encoded_jwt: str | bytes,
+    jwt_secret: SecretType | None = _UNSET,
+    algorithms: Sequence[str] | None = None,
     scopes_required: bool = True,
 ) -> dict[str, Any]:
     """
     Decodes and validates a JSON Web Token (JWT).
 
+    Verified tokens are cached until they expire, so decoding the same token again
+    with the same secret and options skips signature verification and only re-checks the
+    expiration time. The payload is parsed again from the token on every hit, so callers
+    never share it.
+
     Args:
-        encoded_jwt (str): The encoded JWT string to decode.
-        jwt_secret (SecretType | None, optional): The secret key used to decode the JWT. Defaults to JWT_SECRET_KEY.
-        algorithms (list[str] | None, optional): List of acceptable algorithms for decoding. Defaults to [JWT_ALGORITHM].
+        encoded_jwt (str | bytes): The encoded JWT to decode.
+        jwt_secret (SecretType | None, optional): The secret key used to decode the JWT. Defaults to the JWT_SECRET_KEY environment variable.
+        algorithms (Sequence[str] | None, optional): Acceptable algorithms for decoding. Defaults to the JWT_ALGORITHM environment variable, or HS256.
         scopes_required (bool, optional): Whether the 'scopes' claim is required in the JWT. Defaults to True.
 
     Returns:
@@ -132,40 +818,92 @@ def decode_jwt(
                   the issue time is invalid, the token is not yet valid, or the token is otherwise invalid.
     """
     # Ensure that the secret key is provided
-    if jwt_secret is None:
+    secret_value = _get_secret_value(jwt_secret)
+    if secret_value is None:
         raise JWTError("JWT secret key must be provided for decoding.")
 
+    # Use the default algorithm if none is provided
+    if algorithms is None:
+        algorithms = _env_algorithms()
+
+    payload, error = _decode_cached(
+        encoded_jwt, secret_value, algorithms, scopes_required
+    )
+    if error is not None:
+        raise JWTError(error)
+    return payload
+
+
+def decode_jwt_many(
+    encoded_jwts: Sequence[str | bytes],
+    jwt_secret: SecretType | None = _UNSET,
+    algorithms: Sequence[str] | None = None,
+    scopes_required: bool = True,
+) -> list[dict[str, Any] | JWTError]:
+    """
+    Decodes and validates several JSON Web Tokens (JWTs) signed with the same secret.
+
+    Each token is decoded as by `decode_jwt`, sharing its cache, but the HMAC state is keyed
+    with the secret once and copied for every token. Invalid tokens do not interrupt the
+    batch: the JWTError describing them is returned in their place instead of raised.
+
+    Args:
+        encoded_jwts (Sequence[str | bytes]): The encoded JWTs to decode. Entries that are
+            neither str nor bytes, such as None, are reported as invalid tokens.
+        jwt_secret (SecretType | None, optional): The secret key used to decode the JWTs. Defaults to the JWT_SECRET_KEY environment variable.
+        algorithms (Sequence[str] | None, optional): Acceptable algorithms for decoding. Defaults to the JWT_ALGORITHM environment variable, or HS256.
+        scopes_required (bool, optional): Whether the 'scopes' claim is required in the JWTs. Defaults to True.
+
+    Returns:
+        list[dict[str, Any] | JWTError]: The decoded payload, or the JWTError, for each token, in order.
+
+    Raises:
+        JWTError: If the secret key is not provided.
+    """
+    # Ensure that the secret key is provided
     secret_value = _get_secret_value(jwt_secret)
+    if secret_value is None:
+        raise JWTError("JWT secret key must be provided for decoding.")
 
     # Use the default algorithm if none is provided
     if algorithms is None:
-        algorithms = [JWT_ALGORITHM]
+        algorithms = _env_algorithms()
 
-    # Define the required claims for the JWT
-    required_claims = ["exp", "sub", "iat", "nbf"]
-    if scopes_required:
-        required_claims.append("scopes")
-
-    try:
-        return jwt.decode(
-            encoded_jwt,
-            secret_value,
-            options={
-                "require": required_claims,
-                "verify_exp": True,
-                "verify_iat": True,
-                "verify_nbf": True,
-            },
-            algorithms=algorithms,
-            leeway=5,
+    macs = {
+        algorithm: hmac.new(
+            _get_key(secret_value, algorithm), digestmod=_HMAC_DIGESTS[algorithm]
         )
-    except jwt.MissingRequiredClaimError as err:
-        raise JWTError(f"Missing claims: {err.missing_claims}") from err
-    except jwt.ExpiredSignatureError as err:
-        raise JWTError("JWT has expired.") from err
-    except jwt.InvalidIssuedAtError as err:
-        raise JWTError("JWT issue time (iat) is invalid or not an integer.") from err
-    except jwt.exceptions.ImmatureSignatureError as err:
-        raise JWTError("JWT is not yet valid (nbf claim).") from err
-    except jwt.InvalidTokenError as err:
-        raise JWTError("Invalid JWT, unable to decode token.") from err
+        for algorithm in algorithms
+        if algorithm in _HMAC_DIGESTS
+    }
+    results: list[dict[str, Any] | JWTError] = []
+    for encoded_jwt in encoded_jwts:
+        payload, error = _decode_cached(
+            encoded_jwt, secret_value, algorithms, scopes_required, macs
+        )
+        results.append(JWTError(error) if error is not None else payload)
+    return results
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the module-level JWT_ALGORITHM and JWT_SECRET_KEY settings.
+
+    The settings are read from the environment on first use rather than at import, so they
+    are exposed through this module `__getattr__` instead of being bound as constants.
+
+    Args:
+        name (str): The name of the attribute being looked up.
+
+    Returns:
+        Any: The default JWT algorithm, or the JWT secret key (None if it is not set).
+
+    Raises:
+        AttributeError: If the attribute is not one of the settings.
+    """
+    if name == "JWT_ALGORITHM":
+        return _env_algorithm()[0]
+    if name == "JWT_SECRET_KEY":
+        secret = _env_secret()
+        return secret.decode("utf-8") if secret is not None else None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,5 @@
 import uuid, os
+from functools import lru_cache
 from typing import Any, Generic, Optional, Union
 
 from datetime import datetime, timedelta, timezone
@@ -11,10 +12,25 @@ from jafaal.password_hasher import PasswordHasher
 from jafaal.types import DependencyCallable
 
 
-JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(
-    os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
-)
-JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+# Token lifetimes are read from the environment on first use rather than at import
+@lru_cache(maxsize=1)
+def _access_token_lifetime() -> timedelta:
+    return timedelta(minutes=int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "15")))
+
+
+@lru_cache(maxsize=1)
+def _refresh_token_lifetime() -> timedelta:
+    return timedelta(days=int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "7")))
+
+
+def __getattr__(name: str) -> Any:
+    # JWT_ACCESS_TOKEN_EXPIRE_MINUTES and JWT_REFRESH_TOKEN_EXPIRE_DAYS resolve through the
+    # lazy readers above, so they reflect the environment on first use
+    if name == "JWT_ACCESS_TOKEN_EXPIRE_MINUTES":
+        return _access_token_lifetime() // timedelta(minutes=1)
+    if name == "JWT_REFRESH_TOKEN_EXPIRE_DAYS":
+        return _refresh_token_lifetime().days
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class BaseUserManager(Generic[models.UP, models.ID]):
@@ -92,8 +108,8 @@ class BaseUserManager(Generic[models.UP, models.ID]):
         if user.is_verified:
             raise exceptions.UserAlreadyVerified()
 
-        access_token_lifetime = timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-        refresh_token_lifetime = timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+        access_token_lifetime = _access_token_lifetime()
+        refresh_token_lifetime = _refresh_token_lifetime()
 
         token_data = {
             "sub": str(user.id),
@@ -104,16 +120,9 @@ class BaseUserManager(Generic[models.UP, models.ID]):
                 raise jwt.JWTError('JWT payload must include a "scopes" claim.')
             token_data.update({"scopes": scopes})
 
-        access_token = jwt.create_jwt(
-            token_data,
-            access_token_lifetime,
-            jwt_algorithm,
-            jwt_secret,
-            scopes_required,
-        )
-        refresh_token = jwt.create_jwt(
+        access_token, refresh_token = jwt.create_jwts(
             token_data,
-            refresh_token_lifetime,
+            (access_token_lifetime, refresh_token_lifetime),
             jwt_algorithm,
             jwt_secret,
             scopes_required,
@@ -3,6 +3,9 @@ from pydantic import BaseModel, ConfigDict, EmailStr
 
 from jafaal.models import ID
 
+# Fields left out of create_update_dict, shared by every call instead of built each time
+_CREATE_UPDATE_EXCLUDE = frozenset({"id", "is_active", "is_verified"})
+
 
 def model_dump(model: BaseModel, *args, **kwargs) -> dict[str, Any]:
     """
@@ -44,11 +47,7 @@ class CreateUpdateDictModel(BaseModel):
         return model_dump(
             self,
             exclude_unset=True,
-            exclude={
-                "id",
-                "is_active",
-                "is_verified",
-            },
+            exclude=_CREATE_UPDATE_EXCLUDE,
         )
 
 
@@ -0,0 +1,219 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from jafaal.database import SQLAlchemyBaseUserTableUUID, SQLAlchemyUserDatabase
+from jafaal.database_sqlalchemy import base
+from jafaal.database_sqlalchemy.generics import GUID, TIMESTAMPAware
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class User(SQLAlchemyBaseUserTableUUID, Base):
+    pass
+
+
+def run_with_db(test, expire_on_commit=True, executemany_returning=True):
+    """Runs `test(user_db, session)` against a fresh in-memory SQLite database."""
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        engine.dialect.insert_executemany_returning = executemany_returning
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=expire_on_commit)
+        try:
+            async with session_maker() as session:
+                await test(SQLAlchemyUserDatabase(session, User), session)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+def user_dict(index, **values):
+    return {"email": f"User{index}@Example.com", "hashed_password": "hash", **values}
+
+
+@pytest.mark.parametrize("executemany_returning", [True, False])
+def test_create_many_returns_users_in_order(executemany_returning):
+    async def test(user_db, session):
+        users = await user_db.create_many(
+            [user_dict(0), user_dict(1, is_superuser=True), user_dict(2, is_active=False)]
+        )
+        assert [user.email for user in users] == [
+            "user0@example.com",
+            "user1@example.com",
+            "user2@example.com",
+        ]
+        assert [user.is_superuser for user in users] == [False, True, False]
+        assert [user.is_active for user in users] == [True, True, False]
+        assert all(user.id is not None for user in users)
+        assert len(await user_db.get_many([user.id for user in users])) == 3
+
+    run_with_db(test, executemany_returning=executemany_returning)
+
+
+def test_create_many_reloads_users_in_pages(monkeypatch):
+    monkeypatch.setattr(base, "BULK_PAGE_SIZE", 2)
+
+    async def test(user_db, session):
+        selects = []
+
+        def count_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(session.bind.sync_engine, "before_cursor_execute", count_selects)
+        users = await user_db.create_many([user_dict(index) for index in range(5)])
+        assert len(selects) == 3
+        # Reloaded after the commit, so the attributes are readable without a lazy load
+        assert [user.email for user in users] == [
+            f"user{index}@example.com" for index in range(5)
+        ]
+
+    run_with_db(test)
+
+
+@pytest.mark.parametrize("expire_on_commit", [True, False])
+def test_create_and_update(expire_on_commit):
+    async def test(user_db, session):
+        user = await user_db.create(user_dict(0, is_verified=True))
+        assert user.email == "user0@example.com"
+        assert (user.is_active, user.is_superuser, user.is_verified) == (True, False, True)
+
+        user = await user_db.update(
+            user, {"email": "Renamed@Example.com", "is_active": False, "is_superuser": True}
+        )
+        assert user.email == "renamed@example.com"
+        assert (user.is_active, user.is_superuser, user.is_verified) == (False, True, True)
+
+        session.expunge_all()
+        user = await user_db.get(user.id)
+        assert user.email == "renamed@example.com"
+        assert user.flags == 0b110
+
+    run_with_db(test, expire_on_commit=expire_on_commit)
+
+
+def test_flag_defaults_on_transient_instances():
+    user = User(email="user@example.com", hashed_password="hash")
+    assert user.flags is None
+    assert (user.is_active, user.is_superuser, user.is_verified) == (True, False, False)
+
+    user.is_verified = True
+    assert user.flags == 0b101
+    user.is_active = False
+    assert user.flags == 0b100
+
+
+def test_flag_sql_expressions():
+    async def test(user_db, session):
+        users = await user_db.create_many(
+            [user_dict(0), user_dict(1, is_superuser=True), user_dict(2, is_superuser=True)]
+        )
+        superusers = await session.scalars(
+            select(User.email).where(User.is_superuser == True)  # noqa: E712
+        )
+        assert sorted(superusers) == ["user1@example.com", "user2@example.com"]
+
+        await session.execute(
+            update(User).where(User.id == users[0].id).values({User.is_verified: True})
+        )
+        await session.execute(
+            update(User).where(User.id == users[1].id).values({User.is_active: False})
+        )
+        await session.commit()
+        session.expunge_all()
+        flags = dict((await session.execute(select(User.email, User.flags))).all())
+        assert flags == {
+            "user0@example.com": 0b101,
+            "user1@example.com": 0b010,
+            "user2@example.com": 0b011,
+        }
+
+    run_with_db(test)
+
+
+def test_update_many():
+    async def test(user_db, session):
+        users = await user_db.create_many(
+            [user_dict(0), user_dict(1, is_verified=True), user_dict(2)]
+        )
+        await user_db.update_many(
+            [
+                {"id": users[0].id, "email": "Renamed@Example.com"},
+                {"id": users[1].id, "is_superuser": True, "is_verified": False},
+                {"id": users[2].id, "hashed_password": "other", "is_active": False},
+            ]
+        )
+        session.expunge_all()
+        rows = await session.execute(
+            select(User.email, User.hashed_password, User.flags).order_by(User.email)
+        )
+        assert rows.all() == [
+            ("renamed@example.com", "hash", 0b001),
+            ("user1@example.com", "hash", 0b011),
+            ("user2@example.com", "other", 0b000),
+        ]
+
+    run_with_db(test)
+
+
+def test_get_by_email_after_update():
+    async def test(user_db, session):
+        user = await user_db.create(user_dict(0))
+        assert await user_db.get_by_email("USER0@example.com") is user
+
+        await user_db.update(user, {"email": "renamed@example.com"})
+        assert await user_db.get_by_email("user0@example.com") is None
+        assert await user_db.get_by_email("Renamed@Example.com") is user
+
+        await user_db.update_many([{"id": user.id, "email": "again@example.com"}])
+        assert await user_db.get_by_email("renamed@example.com") is None
+        found = await user_db.get_by_email("again@example.com")
+        assert found is not None and found.id == user.id
+
+    run_with_db(test)
+
+
+def test_get_by_email_after_delete():
+    async def test(user_db, session):
+        users = await user_db.create_many([user_dict(0), user_dict(1), user_dict(2)])
+        user_ids = [user.id for user in users]
+        for index in range(3):
+            assert await user_db.get_by_email(f"user{index}@example.com") is not None
+
+        await user_db.delete(users[0])
+        assert await user_db.get_by_email("user0@example.com") is None
+
+        await user_db.delete_many([user_ids[1]])
+        assert await user_db.get_by_email("user1@example.com") is None
+        assert await user_db.get_by_email("user2@example.com") is not None
+        assert [user.id for user in await user_db.get_many(user_ids)] == [user_ids[2]]
+
+    run_with_db(test)
+
+
+def test_guid_binds_without_loading_the_dialect_impl():
+    value = uuid.uuid4()
+    assert GUID().process_bind_param(value, sqlite.dialect()) == str(value)
+    assert GUID().process_bind_param(str(value).upper(), sqlite.dialect()) == str(value)
+    assert GUID().process_bind_param(value, postgresql.dialect()) == str(value)
+    assert GUID().process_bind_param(None, sqlite.dialect()) is None
+
+
+def test_timestamp_aware_converts_without_loading_the_dialect_impl():
+    value = datetime(2024, 1, 2, 3, 4, 5)
+    converted = TIMESTAMPAware().process_result_value(value, sqlite.dialect())
+    assert converted == value.replace(tzinfo=timezone.utc)
+    assert TIMESTAMPAware().process_result_value(value, postgresql.dialect()) is value
+    assert TIMESTAMPAware().process_result_value(None, sqlite.dialect()) is None
@@ -1,7 +1,15 @@
 import pytest
 import jwt as pyjwt
 from datetime import datetime, timedelta, timezone
-from jafaal.jwt import create_jwt, decode_jwt, JWTError  # adjust import path
+from pydantic import SecretStr
+from jafaal import jwt as jafaal_jwt
+from jafaal.jwt import (  # adjust import path
+    create_jwt,
+    create_jwts,
+    decode_jwt,
+    decode_jwt_many,
+    JWTError,
+)
 
 SECRET = "testsecret"
 
@@ -111,3 +119,156 @@ def test_decode_jwt_missing_scopes_when_required():
     token = pyjwt.encode(payload, SECRET, algorithm="HS256")
     with pytest.raises(JWTError):
         decode_jwt(token, jwt_secret=SECRET, scopes_required=True)
+
+
+def test_decode_jwt_cached_payload_is_a_copy():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    first = decode_jwt(token, jwt_secret=SECRET)
+    first["sub"] = "tampered"
+    first["scopes"].append("admin")
+    second = decode_jwt(token, jwt_secret=SECRET)
+    assert second["sub"] == "user123"
+    assert second["scopes"] == ["users:read"]
+    second["scopes"].append("admin")
+    assert decode_jwt(token, jwt_secret=SECRET)["scopes"] == ["users:read"]
+
+
+def test_decode_jwt_cache_is_keyed_by_secret():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    decode_jwt(token, jwt_secret=SECRET)
+    with pytest.raises(JWTError):
+        decode_jwt(token, jwt_secret="othersecret")
+
+
+def test_decode_jwt_cache_is_keyed_by_algorithms():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    decode_jwt(token, jwt_secret=SECRET)
+    with pytest.raises(JWTError):
+        decode_jwt(token, jwt_secret=SECRET, algorithms=["HS512"])
+
+
+def test_jwt_accepts_secret_str_and_bytes():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SecretStr(SECRET),
+    )
+    assert decode_jwt(token, jwt_secret=SECRET.encode())["sub"] == "user123"
+
+
+def test_decode_jwt_cache_is_keyed_by_scopes_required():
+    token = create_jwt(
+        {"sub": "user123"},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+        scopes_required=False,
+    )
+    decode_jwt(token, jwt_secret=SECRET, scopes_required=False)
+    with pytest.raises(JWTError, match="scopes"):
+        decode_jwt(token, jwt_secret=SECRET, scopes_required=True)
+
+
+def test_create_jwt_matches_pyjwt_encoding():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    assert pyjwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    payload = pyjwt.decode(token, SECRET, algorithms=["HS256"])
+    assert token == pyjwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def test_create_jwts_matches_create_jwt():
+    data = {"sub": "user123", "scopes": ["users:read"]}
+    access, refresh = create_jwts(
+        data, (timedelta(minutes=15), timedelta(days=7)), jwt_secret=SECRET
+    )
+    access_payload = decode_jwt(access, jwt_secret=SECRET)
+    refresh_payload = decode_jwt(refresh, jwt_secret=SECRET)
+    assert refresh_payload["exp"] - access_payload["exp"] == 7 * 86400 - 15 * 60
+    assert access == pyjwt.encode(access_payload, SECRET, algorithm="HS256")
+    assert refresh == pyjwt.encode(refresh_payload, SECRET, algorithm="HS256")
+    with pytest.raises(JWTError):
+        create_jwts(data, (timedelta(minutes=1), timedelta(0)), jwt_secret=SECRET)
+
+
+def test_decode_jwt_accepts_tokens_with_other_headers():
+    now = datetime.now(timezone.utc)
+    payload = {
+        "sub": "user123",
+        "scopes": ["users:read"],
+        "iat": int(now.timestamp()),
+        "nbf": int(now.timestamp()),
+        "exp": int((now + timedelta(minutes=5)).timestamp()),
+    }
+    token = pyjwt.encode(payload, SECRET, algorithm="HS256", headers={"kid": "k1"})
+    assert decode_jwt(token, jwt_secret=SECRET) == payload
+
+
+@pytest.mark.parametrize("encoded_jwt", [None, 42])
+def test_decode_jwt_rejects_non_string_tokens(encoded_jwt):
+    with pytest.raises(JWTError, match="unable to decode"):
+        decode_jwt(encoded_jwt, jwt_secret=SECRET)
+
+
+def test_decode_jwt_accepts_bytes_tokens():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    assert decode_jwt(token.encode(), jwt_secret=SECRET)["sub"] == "user123"
+
+
+def test_decode_jwt_many_returns_errors_in_place():
+    token = create_jwt(
+        {"sub": "user123", "scopes": ["users:read"]},
+        timedelta(minutes=1),
+        jwt_secret=SECRET,
+    )
+    other = create_jwt(
+        {"sub": "user456", "scopes": []}, timedelta(minutes=1), jwt_secret=SECRET
+    )
+    payload, error, other_payload, missing, bytes_payload = decode_jwt_many(
+        [token, "not.a.jwt", other, None, token.encode()], jwt_secret=SECRET
+    )
+    assert payload["sub"] == "user123"
+    assert isinstance(error, JWTError)
+    assert other_payload["sub"] == "user456"
+    assert isinstance(missing, JWTError)
+    assert bytes_payload["sub"] == "user123"
+
+
+@pytest.fixture
+def clear_env_settings():
+    readers = (jafaal_jwt._env_algorithm, jafaal_jwt._env_secret)
+    for reader in readers:
+        reader.cache_clear()
+    yield
+    for reader in readers:
+        reader.cache_clear()
+
+
+def test_default_secret_is_read_after_import(clear_env_settings, monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", "envsecret")
+    monkeypatch.setenv("JWT_ALGORITHM", "HS256")
+    token = create_jwt({"sub": "user123", "scopes": []}, timedelta(minutes=1))
+    assert decode_jwt(token)["sub"] == "user123"
+    assert pyjwt.decode(token, "envsecret", algorithms=["HS256"])["sub"] == "user123"
+    assert jafaal_jwt.JWT_SECRET_KEY == "envsecret"
+    assert jafaal_jwt.JWT_ALGORITHM == "HS256"
+    with pytest.raises(AttributeError):
+        jafaal_jwt.JWT_UNKNOWN_SETTING
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+import pytest
+
+import jafaal.database  # noqa: F401 - imported first to avoid a circular import
+from jafaal import manager
+
+
+@pytest.fixture
+def clear_lifetimes():
+    readers = (manager._access_token_lifetime, manager._refresh_token_lifetime)
+    for reader in readers:
+        reader.cache_clear()
+    yield
+    for reader in readers:
+        reader.cache_clear()
+
+
+def test_token_lifetimes_are_read_after_import(clear_lifetimes, monkeypatch):
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+    monkeypatch.setenv("REFRESH_TOKEN_EXPIRE_DAYS", "14")
+    assert manager._access_token_lifetime() == timedelta(minutes=30)
+    assert manager._refresh_token_lifetime() == timedelta(days=14)
+    assert manager.JWT_ACCESS_TOKEN_EXPIRE_MINUTES == 30
+    assert manager.JWT_REFRESH_TOKEN_EXPIRE_DAYS == 14
+    with pytest.raises(AttributeError):
+        manager.JWT_UNKNOWN_SETTING